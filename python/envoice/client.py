@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import httpx
+from pydantic_core import from_json, to_json
 
 from .errors import (
     EnvoiceApiError,
@@ -21,6 +26,13 @@ from .types import (
     ValidationResult,
 )
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Process-wide sync transports for clients created with share_pool=True,
+# keyed by (max_connections, max_keepalive, keepalive_expiry, http2, retries)
+_shared_transports: dict[tuple[int, int, float, bool, int], httpx.HTTPTransport] = {}
+_shared_transports_lock = threading.Lock()
+
 
 class EnvoiceClient:
     """Main client for interacting with the envoice.dev API."""
@@ -31,6 +43,14 @@ class EnvoiceClient:
         *,
         api_url: str = "https://api.envoice.dev",
         timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        retries: int = 0,
+        share_pool: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """
         Create a new EnvoiceClient.
@@ -39,6 +59,19 @@ class EnvoiceClient:
             api_key: Your API key (env_sandbox_* or env_live_*)
             api_url: API base URL (default: https://api.envoice.dev)
             timeout: Request timeout in seconds (default: 30)
+            max_connections: Maximum number of concurrent connections (default: 100)
+            max_keepalive: Maximum number of idle keep-alive connections (default: 20)
+            keepalive_expiry: Seconds an idle connection is kept open (default: 30)
+            http2: Enable HTTP/2, requires the ``h2`` package (default: False)
+            retries: Number of retries on connection errors (default: 0)
+            share_pool: Share the synchronous connection pool with other clients
+                using the same pool settings (default: False)
+            transport: Custom transport for synchronous requests, e.g. an
+                httpx.MockTransport in tests; overrides the pool options
+
+        Setting ``retries``, ``share_pool`` or a custom transport bypasses the
+        HTTP_PROXY/HTTPS_PROXY/ALL_PROXY environment variables.
+            async_transport: Custom transport for asynchronous requests
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -46,8 +79,73 @@ class EnvoiceClient:
         self._api_key = api_key
         self._api_url = api_url.rstrip("/")
         self._timeout = timeout
+        self._max_connections = max_connections
+        self._max_keepalive = max_keepalive
+        self._keepalive_expiry = keepalive_expiry
+        self._http2 = http2
+        self._retries = retries
+        self._share_pool = share_pool
+        self._transport = transport
+        self._async_transport = async_transport
         self._sync_client: httpx.Client | None = None
         self._async_client: httpx.AsyncClient | None = None
+        self._account_etag: str | None = None
+        self._account_cache: AccountInfo | None = None
+
+    def _limits(self) -> httpx.Limits:
+        """Build the connection pool limits."""
+        return httpx.Limits(
+            max_connections=self._max_connections,
+            max_keepalive_connections=self._max_keepalive,
+            keepalive_expiry=self._keepalive_expiry,
+        )
+
+    def _get_sync_transport(self) -> httpx.BaseTransport | None:
+        """Create the synchronous transport, or reuse the shared one.
+
+        Returns None when httpx's default transport will do, so that proxy
+        settings from the environment still apply.
+        """
+        if self._transport is not None:
+            return self._transport
+        if not self._share_pool:
+            if not self._retries:
+                return None
+            return httpx.HTTPTransport(
+                http2=self._http2,
+                limits=self._limits(),
+                retries=self._retries,
+            )
+
+        key = (
+            self._max_connections,
+            self._max_keepalive,
+            self._keepalive_expiry,
+            self._http2,
+            self._retries,
+        )
+        with _shared_transports_lock:
+            transport = _shared_transports.get(key)
+            if transport is None:
+                transport = httpx.HTTPTransport(
+                    http2=self._http2,
+                    limits=self._limits(),
+                    retries=self._retries,
+                )
+                _shared_transports[key] = transport
+        return transport
+
+    def _get_async_transport(self) -> httpx.AsyncBaseTransport | None:
+        """Create the asynchronous transport, or None for httpx's default."""
+        if self._async_transport is not None:
+            return self._async_transport
+        if not self._retries:
+            return None
+        return httpx.AsyncHTTPTransport(
+            http2=self._http2,
+            limits=self._limits(),
+            retries=self._retries,
+        )
 
     def _get_sync_client(self) -> httpx.Client:
         """Get or create the synchronous HTTP client."""
@@ -56,6 +154,9 @@ class EnvoiceClient:
                 base_url=self._api_url,
                 timeout=self._timeout,
                 headers={"X-API-Key": self._api_key},
+                limits=self._limits(),
+                http2=self._http2,
+                transport=self._get_sync_transport(),
             )
         return self._sync_client
 
@@ -66,13 +167,19 @@ class EnvoiceClient:
                 base_url=self._api_url,
                 timeout=self._timeout,
                 headers={"X-API-Key": self._api_key},
+                limits=self._limits(),
+                http2=self._http2,
+                transport=self._get_async_transport(),
             )
         return self._async_client
 
     def close(self) -> None:
         """Close the synchronous HTTP client."""
         if self._sync_client is not None:
-            self._sync_client.close()
+            # A shared pool outlives this client; closing it would drop
+            # connections still in use by other clients.
+            if not self._share_pool:
+                self._sync_client.close()
             self._sync_client = None
 
     async def aclose(self) -> None:
@@ -101,44 +208,62 @@ class EnvoiceClient:
         """Create a new invoice builder with fluent API."""
         return InvoiceBuilder(_client=self)
 
-    def _generate_sync(self, request: GenerateRequest | InvoiceFailure) -> InvoiceResult:
-        """Generate an invoice synchronously (internal)."""
-        if isinstance(request, InvoiceFailure):
-            return request
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, mapping transport failures to EnvoiceNetworkError."""
+        try:
+            return self._get_sync_client().request(method, path, **kwargs)
+        except httpx.TimeoutException:
+            raise EnvoiceNetworkError("Request timeout")
+        except httpx.RequestError as e:
+            raise EnvoiceNetworkError(str(e), cause=e)
 
+    async def _request_async(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request asynchronously, mapping transport failures to EnvoiceNetworkError."""
         try:
-            client = self._get_sync_client()
-            response = client.post(
-                "/v1/generate",
-                json=request.model_dump(by_alias=True, exclude_none=True),
-            )
-            return self._handle_response(response)
+            return await self._get_async_client().request(method, path, **kwargs)
         except httpx.TimeoutException:
             raise EnvoiceNetworkError("Request timeout")
         except httpx.RequestError as e:
             raise EnvoiceNetworkError(str(e), cause=e)
 
+    def _generate_sync(self, request: GenerateRequest | InvoiceFailure) -> InvoiceResult:
+        """Generate an invoice synchronously (internal)."""
+        if isinstance(request, InvoiceFailure):
+            return request
+
+        response = self._request(
+            "POST",
+            "/v1/generate",
+            content=request.model_dump_json(by_alias=True, exclude_none=True),
+            headers=_JSON_HEADERS,
+        )
+        return self._handle_response(response)
+
     async def _generate_async(self, request: GenerateRequest | InvoiceFailure) -> InvoiceResult:
         """Generate an invoice asynchronously (internal)."""
         if isinstance(request, InvoiceFailure):
             return request
 
+        response = await self._request_async(
+            "POST",
+            "/v1/generate",
+            content=request.model_dump_json(by_alias=True, exclude_none=True),
+            headers=_JSON_HEADERS,
+        )
+        return self._handle_response(response)
+
+    @staticmethod
+    def _parse_error(response: httpx.Response) -> ErrorResponse:
+        """Parse an error response body, falling back for non-JSON bodies."""
         try:
-            client = self._get_async_client()
-            response = await client.post(
-                "/v1/generate",
-                json=request.model_dump(by_alias=True, exclude_none=True),
-            )
-            return self._handle_response(response)
-        except httpx.TimeoutException:
-            raise EnvoiceNetworkError("Request timeout")
-        except httpx.RequestError as e:
-            raise EnvoiceNetworkError(str(e), cause=e)
+            return ErrorResponse.model_validate_json(response.content)
+        except Exception:
+            return ErrorResponse(error="unknown_error", message=f"HTTP {response.status_code}")
 
     def _handle_response(self, response: httpx.Response) -> InvoiceResult:
         """Handle the API response."""
         if response.status_code == 200:
-            data = GenerateResponse.model_validate(response.json())
+            data = GenerateResponse.model_validate_json(response.content)
             return InvoiceSuccess(
                 pdf_base64=data.pdf_base64,
                 filename=data.filename,
@@ -146,11 +271,7 @@ class EnvoiceClient:
                 account=data.account,
             )
 
-        # Handle errors
-        try:
-            error_data = ErrorResponse.model_validate(response.json())
-        except Exception:
-            error_data = ErrorResponse(error="unknown_error", message=f"HTTP {response.status_code}")
+        error_data = self._parse_error(response)
 
         if response.status_code == 402:
             raise EnvoiceQuotaExceededError(error_data.message or "Quota exceeded")
@@ -168,92 +289,119 @@ class EnvoiceClient:
         """Generate an invoice directly (without builder)."""
         return self._generate_sync(request)
 
+    def generate_invoices(
+        self,
+        requests: Iterable[GenerateRequest],
+        *,
+        concurrency: int = 8,
+    ) -> list[InvoiceResult]:
+        """
+        Generate multiple invoices using up to ``concurrency`` worker threads.
+
+        Results are returned in the same order as the requests.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        # Create the pooled client up front so worker threads don't race to build it
+        self._get_sync_client()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self._generate_sync, requests))
+
     async def generate_invoice_async(self, request: GenerateRequest) -> InvoiceResult:
         """Generate an invoice directly asynchronously."""
         return await self._generate_async(request)
 
+    async def generate_invoices_async(
+        self,
+        requests: Iterable[GenerateRequest],
+        *,
+        concurrency: int = 16,
+    ) -> list[InvoiceResult]:
+        """
+        Generate multiple invoices with up to ``concurrency`` requests in flight.
+
+        Results are returned in the same order as the requests.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_one(request: GenerateRequest) -> InvoiceResult:
+            async with semaphore:
+                return await self._generate_async(request)
+
+        return list(await asyncio.gather(*(generate_one(r) for r in requests)))
+
     def validate(self, pdf_base64: str) -> dict[str, Any]:
         """Validate an existing PDF for ZUGFeRD/Factur-X compliance."""
-        try:
-            client = self._get_sync_client()
-            response = client.post(
-                "/v1/validate",
-                json={"pdf_base64": pdf_base64},
+        response = self._request(
+            "POST",
+            "/v1/validate",
+            content=to_json({"pdf_base64": pdf_base64}),
+            headers=_JSON_HEADERS,
+        )
+
+        if not response.is_success:
+            error_data = self._parse_error(response)
+            raise EnvoiceApiError(
+                error_data.message or error_data.error,
+                response.status_code,
+                error_data.error,
             )
 
-            if not response.is_success:
-                error_data = ErrorResponse.model_validate(response.json())
-                raise EnvoiceApiError(
-                    error_data.message or error_data.error,
-                    response.status_code,
-                    error_data.error,
-                )
-
-            return response.json()
-        except httpx.TimeoutException:
-            raise EnvoiceNetworkError("Request timeout")
-        except httpx.RequestError as e:
-            raise EnvoiceNetworkError(str(e), cause=e)
+        return from_json(response.content)
 
     async def validate_async(self, pdf_base64: str) -> dict[str, Any]:
         """Validate an existing PDF asynchronously."""
-        try:
-            client = self._get_async_client()
-            response = await client.post(
-                "/v1/validate",
-                json={"pdf_base64": pdf_base64},
+        response = await self._request_async(
+            "POST",
+            "/v1/validate",
+            content=to_json({"pdf_base64": pdf_base64}),
+            headers=_JSON_HEADERS,
+        )
+
+        if not response.is_success:
+            error_data = self._parse_error(response)
+            raise EnvoiceApiError(
+                error_data.message or error_data.error,
+                response.status_code,
+                error_data.error,
             )
 
-            if not response.is_success:
-                error_data = ErrorResponse.model_validate(response.json())
-                raise EnvoiceApiError(
-                    error_data.message or error_data.error,
-                    response.status_code,
-                    error_data.error,
-                )
+        return from_json(response.content)
+
+    def _account_headers(self) -> dict[str, str]:
+        """Build conditional request headers for the account endpoint."""
+        if self._account_etag is not None and self._account_cache is not None:
+            return {"If-None-Match": self._account_etag}
+        return {}
+
+    def _handle_account_response(self, response: httpx.Response) -> AccountInfo:
+        """Handle the account response, reusing the cached info on 304."""
+        if response.status_code == 304 and self._account_cache is not None:
+            return self._account_cache
+
+        if not response.is_success:
+            error_data = self._parse_error(response)
+            raise EnvoiceApiError(
+                error_data.message or error_data.error,
+                response.status_code,
+                error_data.error,
+            )
 
-            return response.json()
-        except httpx.TimeoutException:
-            raise EnvoiceNetworkError("Request timeout")
-        except httpx.RequestError as e:
-            raise EnvoiceNetworkError(str(e), cause=e)
+        account = AccountInfo.model_validate_json(response.content)
+        self._account_etag = response.headers.get("ETag")
+        self._account_cache = account
+        return account
 
     def get_account(self) -> AccountInfo:
         """Get account information (quota, plan, etc.)."""
-        try:
-            client = self._get_sync_client()
-            response = client.get("/v1/account")
-
-            if not response.is_success:
-                error_data = ErrorResponse.model_validate(response.json())
-                raise EnvoiceApiError(
-                    error_data.message or error_data.error,
-                    response.status_code,
-                    error_data.error,
-                )
-
-            return AccountInfo.model_validate(response.json())
-        except httpx.TimeoutException:
-            raise EnvoiceNetworkError("Request timeout")
-        except httpx.RequestError as e:
-            raise EnvoiceNetworkError(str(e), cause=e)
+        response = self._request("GET", "/v1/account", headers=self._account_headers())
+        return self._handle_account_response(response)
 
     async def get_account_async(self) -> AccountInfo:
         """Get account information asynchronously."""
-        try:
-            client = self._get_async_client()
-            response = await client.get("/v1/account")
-
-            if not response.is_success:
-                error_data = ErrorResponse.model_validate(response.json())
-                raise EnvoiceApiError(
-                    error_data.message or error_data.error,
-                    response.status_code,
-                    error_data.error,
-                )
-
-            return AccountInfo.model_validate(response.json())
-        except httpx.TimeoutException:
-            raise EnvoiceNetworkError("Request timeout")
-        except httpx.RequestError as e:
-            raise EnvoiceNetworkError(str(e), cause=e)
+        response = await self._request_async("GET", "/v1/account", headers=self._account_headers())
+        return self._handle_account_response(response)
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import base64
-from dataclasses import dataclass, field
+import binascii
+import copy
+import os
+import re
+from dataclasses import dataclass, field, fields, replace
 from datetime import date
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from .types import (
+    AccountInfo,
     Customization,
     GenerateRequest,
     InvoiceData,
@@ -17,14 +22,51 @@ from .types import (
     PaymentInfo,
     ValidationError,
     ValidationResult,
-    AccountInfo,
 )
 
 if TYPE_CHECKING:
     from .client import EnvoiceClient
 
+# Size of the Base64 slices decoded by save_pdf; must be a multiple of 4.
+_DECODE_CHUNK_SIZE = 64 * 1024
+
+# Plain Base64 without whitespace; together with a length that is a multiple of 4,
+# every slice holds whole 4-character groups and cannot fail to decode
+_PLAIN_BASE64_RE = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+# Flags for creating/truncating PDF files (O_BINARY prevents newline translation on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Client-side errors for missing required fields (immutable, shared between results).
+# The literals are known-good, so they skip validation.
+_ERR_NUMBER = ValidationError.model_construct(
+    path="$.invoice.number",
+    code="REQUIRED",
+    message="Invoice number is required",
+)
+_ERR_DATE = ValidationError.model_construct(
+    path="$.invoice.date",
+    code="REQUIRED",
+    message="Invoice date is required",
+)
+_ERR_SELLER = ValidationError.model_construct(
+    path="$.invoice.seller",
+    code="REQUIRED",
+    message="Seller information is required",
+)
+_ERR_BUYER = ValidationError.model_construct(
+    path="$.invoice.buyer",
+    code="REQUIRED",
+    message="Buyer information is required",
+)
+_ERR_ITEMS = ValidationError.model_construct(
+    path="$.invoice.items",
+    code="REQUIRED",
+    message="At least one line item is required",
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class InvoiceSuccess:
     """Result object returned after successful invoice generation."""
 
@@ -32,6 +74,7 @@ class InvoiceSuccess:
     filename: str
     validation: ValidationResult
     account: AccountInfo | None = None
+    _pdf_bytes: bytes | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def success(self) -> Literal[True]:
@@ -41,19 +84,39 @@ class InvoiceSuccess:
     def save_pdf(self, file_path: str | Path) -> None:
         """Save the PDF to a file."""
         path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(base64.b64decode(self.pdf_base64))
+        data = self.pdf_base64
+        pdf_bytes = self._pdf_bytes
+        if pdf_bytes is None and (len(data) % 4 or not _PLAIN_BASE64_RE.fullmatch(data)):
+            # Decode up front so invalid input raises before the file is truncated
+            pdf_bytes = self.to_bytes()
+
+        try:
+            fd = os.open(path, _WRITE_FLAGS, 0o666)
+        except FileNotFoundError:
+            # Only create missing parent directories when the first open fails
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, _WRITE_FLAGS, 0o666)
+
+        with open(fd, "wb") as f:
+            if pdf_bytes is not None:
+                f.write(pdf_bytes)
+            else:
+                # Decode in slices so large PDFs are never held in memory twice
+                for start in range(0, len(data), _DECODE_CHUNK_SIZE):
+                    f.write(binascii.a2b_base64(data[start : start + _DECODE_CHUNK_SIZE]))
 
     def to_bytes(self) -> bytes:
         """Get the PDF as bytes."""
-        return base64.b64decode(self.pdf_base64)
+        if self._pdf_bytes is None:
+            self._pdf_bytes = base64.b64decode(self.pdf_base64)
+        return self._pdf_bytes
 
     def to_data_url(self) -> str:
         """Get the PDF as a data URL."""
         return f"data:application/pdf;base64,{self.pdf_base64}"
 
 
-@dataclass
+@dataclass(slots=True)
 class InvoiceFailure:
     """Result object returned when invoice generation fails."""
 
@@ -65,14 +128,14 @@ class InvoiceFailure:
         return False
 
 
-InvoiceResult = Union[InvoiceSuccess, InvoiceFailure]
+InvoiceResult = InvoiceSuccess | InvoiceFailure
 
 
-@dataclass
+@dataclass(slots=True)
 class InvoiceBuilder:
     """Fluent builder for creating invoices."""
 
-    _client: "EnvoiceClient"
+    _client: EnvoiceClient
     _number: str | None = None
     _date: str | None = None
     _due_date: str | None = None
@@ -85,6 +148,40 @@ class InvoiceBuilder:
     _locale: str = "en"
     _customization: Customization = field(default_factory=Customization)
 
+    # Required attributes and the error reported when each is missing
+    _REQUIRED_CHECKS: ClassVar[tuple[tuple[str, ValidationError], ...]] = (
+        ("_number", _ERR_NUMBER),
+        ("_date", _ERR_DATE),
+        ("_seller", _ERR_SELLER),
+        ("_buyer", _ERR_BUYER),
+        ("_items", _ERR_ITEMS),
+    )
+
+    def __copy__(self) -> "InvoiceBuilder":
+        """Copy the builder; the copy gets its own item list and customization.
+
+        The client and the Party, PaymentInfo and LineItem models are shared with
+        the original. The setters replace these models rather than changing them,
+        but mutating one directly affects both builders; use copy.deepcopy() for
+        fully independent models.
+        """
+        return replace(
+            self,
+            _items=list(self._items),
+            _customization=self._customization.model_copy(),
+        )
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "InvoiceBuilder":
+        """Deep-copy the builder's models while keeping the same client."""
+        return replace(
+            self,
+            **{
+                f.name: copy.deepcopy(getattr(self, f.name), memo)
+                for f in fields(self)
+                if f.name != "_client"
+            },
+        )
+
     def number(self, value: str) -> "InvoiceBuilder":
         """Set the invoice number."""
         self._number = value
@@ -231,9 +328,10 @@ class InvoiceBuilder:
 
     def logo_file(self, file_path: str | Path, width_mm: int | None = None) -> "InvoiceBuilder":
         """Set a logo from a local file path."""
-        path = Path(file_path)
-        logo_bytes = path.read_bytes()
-        self._customization.logo_base64 = base64.b64encode(logo_bytes).decode("utf-8")
+        logo_bytes = Path(file_path).read_bytes()
+        self._customization.logo_base64 = binascii.b2a_base64(logo_bytes, newline=False).decode(
+            "ascii"
+        )
         if width_mm is not None:
             self._customization.logo_width_mm = width_mm
         return self
@@ -265,60 +363,13 @@ class InvoiceBuilder:
 
     def _build_request(self) -> GenerateRequest | InvoiceFailure:
         """Build the request object, validating required fields."""
-        errors: list[ValidationError] = []
-
-        if not self._number:
-            errors.append(
-                ValidationError(
-                    path="$.invoice.number",
-                    code="REQUIRED",
-                    message="Invoice number is required",
-                )
-            )
-        if not self._date:
-            errors.append(
-                ValidationError(
-                    path="$.invoice.date",
-                    code="REQUIRED",
-                    message="Invoice date is required",
-                )
-            )
-        if not self._seller:
-            errors.append(
-                ValidationError(
-                    path="$.invoice.seller",
-                    code="REQUIRED",
-                    message="Seller information is required",
-                )
-            )
-        if not self._buyer:
-            errors.append(
-                ValidationError(
-                    path="$.invoice.buyer",
-                    code="REQUIRED",
-                    message="Buyer information is required",
-                )
-            )
-        if not self._items:
-            errors.append(
-                ValidationError(
-                    path="$.invoice.items",
-                    code="REQUIRED",
-                    message="At least one line item is required",
-                )
-            )
-
+        errors = [error for attr, error in self._REQUIRED_CHECKS if not getattr(self, attr)]
         if errors:
             return InvoiceFailure(errors=errors)
 
         # Build customization only if there's content
-        customization = None
-        if (
-            self._customization.logo_base64
-            or self._customization.footer_text
-            or self._customization.accent_color
-        ):
-            customization = self._customization
+        c = self._customization
+        customization = c if c.logo_base64 or c.footer_text or c.accent_color else None
 
         return GenerateRequest(
             template=self._template,
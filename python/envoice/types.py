@@ -107,6 +107,8 @@ class ValidationError(BaseModel):
     message: str
     severity: Literal["error", "warning"] = "error"
 
+    model_config = {"frozen": True}
+
 
 class GenerateResponse(BaseModel):
     """Successful API response."""
@@ -0,0 +1,43 @@
+"""Shared fixtures for the envoice tests."""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture(scope="session")
+def mock_routes() -> dict[tuple[str, str], Handler]:
+    """Route table of the mock transport, keyed by (method, url)."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def mock_transport(mock_routes: dict[tuple[str, str], Handler]) -> httpx.MockTransport:
+    """Create one mock transport that dispatches every request through the route table."""
+
+    def dispatch(request: httpx.Request) -> httpx.Response:
+        handler = mock_routes.get((request.method, str(request.url)))
+        if handler is None:
+            raise AssertionError(f"No route registered for {request.method} {request.url}")
+        return handler(request)
+
+    return httpx.MockTransport(dispatch)
+
+
+@pytest.fixture
+def add_route(mock_routes: dict[tuple[str, str], Handler]) -> Iterator[Callable[..., None]]:
+    """Register routes on the mock transport for the current test."""
+
+    def add(method: str, url: str, handler: Handler | None = None, **response: Any) -> None:
+        if handler is None:
+            response.setdefault("status_code", 200)
+            mock_routes[(method, url)] = lambda request: httpx.Response(**response)
+        else:
+            mock_routes[(method, url)] = handler
+
+    yield add
+    mock_routes.clear()
@@ -1,22 +1,224 @@
 """Tests for the EnvoiceClient."""
 
+import copy
+import gc
+import json
+import re
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+import pytest_asyncio
 
 from envoice import (
-    EnvoiceClient,
     EnvoiceApiError,
+    EnvoiceClient,
     EnvoiceNetworkError,
     EnvoiceQuotaExceededError,
+    GenerateRequest,
+    InvoiceBuilder,
+    InvoiceData,
+    LineItem,
+    Party,
 )
 
+# Signature of the add_route fixture from conftest.py
+AddRoute = Callable[..., None]
+
+_API_KEY_RE = re.compile("API key is required")
+_QUOTA_RE = re.compile("Monthly quota exceeded")
+_TIMEOUT_RE = re.compile("Request timeout")
+
+_VALIDATION_JSON = {
+    "status": "valid",
+    "profile": "EN16931",
+    "version": "2.3.2",
+}
+
+_GENERATE_OK_JSON = {
+    "pdf_base64": "JVBERi0xLjQK...",
+    "filename": "invoice-2026-001.pdf",
+    "validation": _VALIDATION_JSON,
+    "account": {
+        "remaining": 499,
+        "plan": "starter",
+    },
+}
+
+_VALIDATION_ERROR_JSON = {
+    "error": "validation_error",
+    "message": "Validation failed",
+    "details": [
+        {
+            "path": "$.invoice.seller.vatId",
+            "code": "INVALID_FORMAT",
+            "message": "Invalid VAT ID format",
+        }
+    ],
+}
+
+_QUOTA_EXCEEDED_JSON = {
+    "error": "quota_exceeded",
+    "message": "Monthly quota exceeded",
+}
+
+_INTERNAL_ERROR_JSON = {
+    "error": "internal_error",
+    "message": "Internal server error",
+}
+
+_VALIDATE_OK_JSON = {
+    "valid": True,
+    "profile": "EN16931",
+    "version": "2.3.2",
+    "errors": [],
+    "warnings": [],
+}
+
+_ACCOUNT_JSON = {
+    "plan": "starter",
+    "remaining": 450,
+    "used": 50,
+    "limit": 500,
+}
+
+
+@pytest.fixture(scope="module")
+def client(mock_transport: httpx.MockTransport) -> Iterator[EnvoiceClient]:
+    """Create a client shared by the tests in this module."""
+    with EnvoiceClient(
+        "env_sandbox_test",
+        transport=mock_transport,
+        async_transport=mock_transport,
+    ) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_client(client: EnvoiceClient) -> AsyncIterator[EnvoiceClient]:
+    """Expose the shared client to async tests and close its async side on the module loop."""
+    async with client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def invoice_template(client: EnvoiceClient) -> InvoiceBuilder:
+    """Build the canonical valid invoice once per module."""
+    return (
+        client.invoice()
+        .number("2026-001")
+        .date("2026-01-15")
+        .seller("Acme GmbH", vat_id="DE123456789", city="Berlin", country="DE")
+        .buyer("Customer AG", city="München", country="DE")
+        .add_item("Consulting", quantity=8, unit_price=150.0)
+    )
+
+
+@pytest.fixture
+def valid_invoice(invoice_template: InvoiceBuilder) -> InvoiceBuilder:
+    """Create a fresh copy of the canonical valid invoice."""
+    return copy.copy(invoice_template)
+
+
+_BULK_NUMBERS = ("2026-001", "2026-002", "2026-003")
+
+
+def _bulk_requests() -> list[GenerateRequest]:
+    """Build one request per invoice number in _BULK_NUMBERS."""
+    return [
+        GenerateRequest(
+            invoice=InvoiceData(
+                number=number,
+                date="2026-01-15",
+                seller=Party(name="Acme GmbH"),
+                buyer=Party(name="Customer AG"),
+                items=[LineItem(description="Consulting", quantity=8, unit_price=150.0)],
+            )
+        )
+        for number in _BULK_NUMBERS
+    ]
+
+
+def _bulk_request_json(number: str) -> dict[str, object]:
+    """Expected request body for an invoice number in _BULK_NUMBERS."""
+    return {
+        "template": "minimal",
+        "locale": "en",
+        "invoice": {
+            "number": number,
+            "date": "2026-01-15",
+            "seller": {"name": "Acme GmbH"},
+            "buyer": {"name": "Customer AG"},
+            "items": [
+                {
+                    "description": "Consulting",
+                    "quantity": 8.0,
+                    "unit": "C62",
+                    "unitPrice": 150.0,
+                    "vatRate": 19.0,
+                }
+            ],
+            "currency": "EUR",
+        },
+    }
+
+
+def _bulk_handler(request: httpx.Request) -> httpx.Response:
+    """Answer a bulk generate request with a filename derived from its invoice number."""
+    body = json.loads(request.content)
+    number = body["invoice"]["number"]
+    assert body == _bulk_request_json(number)
+    return httpx.Response(200, json={**_GENERATE_OK_JSON, "filename": f"invoice-{number}.pdf"})
+
+
+def _raise(exc: Exception) -> Callable[[httpx.Request], httpx.Response]:
+    """Build a route handler that raises the given transport error."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise exc
+
+    return handler
+
+
+def _expect_success(invoice: InvoiceBuilder) -> None:
+    """Generate and check the result of a 200 response."""
+    result = invoice.generate()
+    assert result.success is True
+    assert result.pdf_base64 == "JVBERi0xLjQK..."
+    assert result.filename == "invoice-2026-001.pdf"
+    assert result.validation.profile == "EN16931"
+    assert result.account.remaining == 499
+
+
+def _expect_validation_failure(invoice: InvoiceBuilder) -> None:
+    """Generate and check that a 422 response becomes an InvoiceFailure."""
+    result = invoice.generate()
+    assert result.success is False
+    assert len(result.errors) == 1
+    assert result.errors[0].path == "$.invoice.seller.vatId"
+    assert result.errors[0].code == "INVALID_FORMAT"
+
+
+def _expect_quota_exceeded(invoice: InvoiceBuilder) -> None:
+    """Generate and check that a 402 response raises EnvoiceQuotaExceededError."""
+    with pytest.raises(EnvoiceQuotaExceededError, match=_QUOTA_RE):
+        invoice.generate()
+
+
+def _expect_api_error(invoice: InvoiceBuilder) -> None:
+    """Generate and check that a 500 response raises EnvoiceApiError."""
+    with pytest.raises(EnvoiceApiError) as exc_info:
+        invoice.generate()
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.code == "internal_error"
+
 
 class TestEnvoiceClient:
     """Tests for the EnvoiceClient class."""
 
     def test_client_requires_api_key(self) -> None:
         """Test that client requires an API key."""
-        with pytest.raises(ValueError, match="API key is required"):
+        with pytest.raises(ValueError, match=_API_KEY_RE):
             EnvoiceClient("")
 
     def test_client_creation(self) -> None:
@@ -36,6 +238,59 @@ class TestEnvoiceClient:
         assert client._api_url == "https://custom.api.url"
         assert client._timeout == 60.0
 
+    def test_client_connection_pool_options(self) -> None:
+        """Test client creation with connection pool options."""
+        client = EnvoiceClient(
+            "env_sandbox_test",
+            max_connections=50,
+            max_keepalive=10,
+            keepalive_expiry=60.0,
+            retries=2,
+        )
+        assert client._max_connections == 50
+        assert client._max_keepalive == 10
+        assert client._keepalive_expiry == 60.0
+        assert client._http2 is False
+        assert client._retries == 2
+
+        limits = client._limits()
+        assert limits.max_connections == 50
+        assert limits.max_keepalive_connections == 10
+        assert limits.keepalive_expiry == 60.0
+
+    def test_client_shared_pool(self) -> None:
+        """Test that clients with share_pool=True reuse one transport."""
+        first = EnvoiceClient("env_sandbox_one", share_pool=True)
+        second = EnvoiceClient("env_sandbox_two", share_pool=True)
+        separate = EnvoiceClient("env_sandbox_three")
+
+        transport = first._get_sync_client()._transport
+        assert second._get_sync_client()._transport is transport
+        assert separate._get_sync_client()._transport is not transport
+
+        first.close()
+        second.close()
+        separate.close()
+
+    def test_client_uses_env_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the default transports honour proxy environment variables."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:8080")
+        client = EnvoiceClient("env_sandbox_test")
+
+        assert client._get_sync_client()._mounts
+        assert client._get_async_client()._mounts
+        client.close()
+
+    def test_client_custom_transport(self, mock_transport: httpx.MockTransport) -> None:
+        """Test that custom transports replace the pooled ones."""
+        client = EnvoiceClient(
+            "env_sandbox_test",
+            transport=mock_transport,
+            async_transport=mock_transport,
+        )
+        assert client._get_sync_client()._transport is mock_transport
+        assert client._get_async_client()._transport is mock_transport
+
     def test_client_context_manager(self) -> None:
         """Test client as context manager."""
         with EnvoiceClient("env_sandbox_test") as client:
@@ -45,262 +300,254 @@ class TestEnvoiceClient:
         """Test creating an invoice builder."""
         client = EnvoiceClient("env_sandbox_test")
         builder = client.invoice()
-        assert builder._client == client
+        assert builder._client is client
+
+    def test_invoice_builder_keeps_client_alive(
+        self, mock_transport: httpx.MockTransport, add_route: AddRoute
+    ) -> None:
+        """Test that a builder still works after its client goes out of scope."""
+        add_route("POST", "https://api.envoice.dev/v1/generate", json=_GENERATE_OK_JSON)
+
+        def make_builder() -> InvoiceBuilder:
+            client = EnvoiceClient("env_sandbox_test", transport=mock_transport)
+            return client.invoice()
+
+        builder = make_builder().number("2026-001").date("2026-01-15")
+        builder.seller("Acme").buyer("Customer").add_item("Item", 1, 100)
+        gc.collect()
+
+        assert builder.generate().success is True
 
 
 class TestGenerateInvoice:
     """Tests for invoice generation."""
 
-    def test_successful_generation(self, httpx_mock: HTTPXMock) -> None:
-        """Test successful invoice generation."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://api.envoice.dev/v1/generate",
-            json={
-                "pdf_base64": "JVBERi0xLjQK...",
-                "filename": "invoice-2026-001.pdf",
-                "validation": {
-                    "status": "valid",
-                    "profile": "EN16931",
-                    "version": "2.3.2",
-                },
-                "account": {
-                    "remaining": 499,
-                    "plan": "starter",
-                },
-            },
+    @pytest.mark.parametrize(
+        "status,body,check",
+        [
+            (200, _GENERATE_OK_JSON, _expect_success),
+            (422, _VALIDATION_ERROR_JSON, _expect_validation_failure),
+            (402, _QUOTA_EXCEEDED_JSON, _expect_quota_exceeded),
+            (500, _INTERNAL_ERROR_JSON, _expect_api_error),
+        ],
+        ids=["success", "validation_errors", "quota_exceeded", "api_error"],
+    )
+    def test_generate(
+        self,
+        valid_invoice: InvoiceBuilder,
+        add_route: AddRoute,
+        status: int,
+        body: dict[str, object],
+        check: Callable[[InvoiceBuilder], None],
+    ) -> None:
+        """Test how each generate response status is surfaced to the caller."""
+        add_route(
+            "POST",
+            "https://api.envoice.dev/v1/generate",
+            status_code=status,
+            json=body,
         )
 
-        with EnvoiceClient("env_sandbox_test") as client:
-            result = (
-                client.invoice()
-                .number("2026-001")
-                .date("2026-01-15")
-                .seller("Acme GmbH", vat_id="DE123456789", city="Berlin", country="DE")
-                .buyer("Customer AG", city="München", country="DE")
-                .add_item("Consulting", quantity=8, unit_price=150.0)
-                .generate()
-            )
+        check(valid_invoice)
+
+    @pytest.mark.parametrize(
+        "build,expected_path",
+        [
+            (
+                lambda b: (
+                    b.date("2026-01-15").seller("Acme").buyer("Customer").add_item("Item", 1, 100)
+                ),
+                "$.invoice.number",
+            ),
+            (
+                lambda b: b.number("001").seller("Acme").buyer("Customer").add_item("Item", 1, 100),
+                "$.invoice.date",
+            ),
+            (
+                lambda b: (
+                    b.number("001").date("2026-01-15").buyer("Customer").add_item("Item", 1, 100)
+                ),
+                "$.invoice.seller",
+            ),
+            (
+                lambda b: (
+                    b.number("001").date("2026-01-15").seller("Acme").add_item("Item", 1, 100)
+                ),
+                "$.invoice.buyer",
+            ),
+            (
+                lambda b: b.number("001").date("2026-01-15").seller("Acme").buyer("Customer"),
+                "$.invoice.items",
+            ),
+        ],
+        ids=["number", "date", "seller", "buyer", "items"],
+    )
+    def test_missing_required_fields(
+        self,
+        client: EnvoiceClient,
+        build: Callable[[InvoiceBuilder], InvoiceBuilder],
+        expected_path: str,
+    ) -> None:
+        """Test client-side validation for missing fields."""
+        result = build(client.invoice()).generate()
+        assert result.success is False
+        assert any(e.path == expected_path for e in result.errors)
 
-        assert result.success is True
-        assert result.pdf_base64 == "JVBERi0xLjQK..."
-        assert result.filename == "invoice-2026-001.pdf"
-        assert result.validation.profile == "EN16931"
-        assert result.account.remaining == 499
-
-    def test_validation_errors(self, httpx_mock: HTTPXMock) -> None:
-        """Test handling of validation errors."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://api.envoice.dev/v1/generate",
-            status_code=422,
-            json={
-                "error": "validation_error",
-                "message": "Validation failed",
-                "details": [
-                    {
-                        "path": "$.invoice.seller.vatId",
-                        "code": "INVALID_FORMAT",
-                        "message": "Invalid VAT ID format",
-                    }
-                ],
-            },
-        )
+    def test_bulk_generation(self, client: EnvoiceClient, add_route: AddRoute) -> None:
+        """Test generating several invoices on worker threads."""
+        add_route("POST", "https://api.envoice.dev/v1/generate", _bulk_handler)
 
-        with EnvoiceClient("env_sandbox_test") as client:
-            result = (
-                client.invoice()
-                .number("2026-001")
-                .date("2026-01-15")
-                .seller("Acme GmbH", vat_id="INVALID", city="Berlin", country="DE")
-                .buyer("Customer AG", city="München", country="DE")
-                .add_item("Consulting", quantity=8, unit_price=150.0)
-                .generate()
-            )
+        results = client.generate_invoices(_bulk_requests(), concurrency=2)
 
-        assert result.success is False
-        assert len(result.errors) == 1
-        assert result.errors[0].path == "$.invoice.seller.vatId"
-        assert result.errors[0].code == "INVALID_FORMAT"
-
-    def test_quota_exceeded(self, httpx_mock: HTTPXMock) -> None:
-        """Test handling of quota exceeded error."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://api.envoice.dev/v1/generate",
-            status_code=402,
-            json={
-                "error": "quota_exceeded",
-                "message": "Monthly quota exceeded",
-            },
-        )
-
-        with EnvoiceClient("env_sandbox_test") as client:
-            with pytest.raises(EnvoiceQuotaExceededError, match="Monthly quota exceeded"):
-                (
-                    client.invoice()
-                    .number("2026-001")
-                    .date("2026-01-15")
-                    .seller("Acme GmbH", vat_id="DE123456789")
-                    .buyer("Customer AG")
-                    .add_item("Consulting", quantity=8, unit_price=150.0)
-                    .generate()
-                )
-
-    def test_api_error(self, httpx_mock: HTTPXMock) -> None:
-        """Test handling of API errors."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://api.envoice.dev/v1/generate",
-            status_code=500,
-            json={
-                "error": "internal_error",
-                "message": "Internal server error",
-            },
-        )
+        assert [r.filename for r in results] == [f"invoice-{n}.pdf" for n in _BULK_NUMBERS]
 
-        with EnvoiceClient("env_sandbox_test") as client:
-            with pytest.raises(EnvoiceApiError) as exc_info:
-                (
-                    client.invoice()
-                    .number("2026-001")
-                    .date("2026-01-15")
-                    .seller("Acme GmbH", vat_id="DE123456789")
-                    .buyer("Customer AG")
-                    .add_item("Consulting", quantity=8, unit_price=150.0)
-                    .generate()
-                )
-
-        assert exc_info.value.status_code == 500
-        assert exc_info.value.code == "internal_error"
-
-    def test_missing_required_fields(self) -> None:
-        """Test client-side validation for missing fields."""
-        client = EnvoiceClient("env_sandbox_test")
 
-        # Missing number
-        result = client.invoice().date("2026-01-15").seller("Acme").buyer("Customer").add_item("Item", 1, 100).generate()
-        assert result.success is False
-        assert any(e.path == "$.invoice.number" for e in result.errors)
+class TestNetworkErrors:
+    """Tests for transport failure handling."""
 
-        # Missing date
-        result = client.invoice().number("001").seller("Acme").buyer("Customer").add_item("Item", 1, 100).generate()
-        assert result.success is False
-        assert any(e.path == "$.invoice.date" for e in result.errors)
+    def test_timeout(self, client: EnvoiceClient, add_route: AddRoute) -> None:
+        """Test that timeouts raise EnvoiceNetworkError."""
+        add_route(
+            "GET",
+            "https://api.envoice.dev/v1/account",
+            _raise(httpx.ReadTimeout("timed out")),
+        )
 
-        # Missing seller
-        result = client.invoice().number("001").date("2026-01-15").buyer("Customer").add_item("Item", 1, 100).generate()
-        assert result.success is False
-        assert any(e.path == "$.invoice.seller" for e in result.errors)
+        with pytest.raises(EnvoiceNetworkError, match=_TIMEOUT_RE):
+            client.get_account()
+
+    async def test_async_connection_error(
+        self, add_route: AddRoute, mock_transport: httpx.MockTransport
+    ) -> None:
+        """Test that connection failures raise EnvoiceNetworkError with the cause."""
+        add_route(
+            "POST",
+            "https://api.envoice.dev/v1/validate",
+            _raise(httpx.ConnectError("connection refused")),
+        )
 
-        # Missing buyer
-        result = client.invoice().number("001").date("2026-01-15").seller("Acme").add_item("Item", 1, 100).generate()
-        assert result.success is False
-        assert any(e.path == "$.invoice.buyer" for e in result.errors)
+        async with EnvoiceClient("env_sandbox_test", async_transport=mock_transport) as client:
+            with pytest.raises(EnvoiceNetworkError) as exc_info:
+                await client.validate_async("JVBERi0xLjQK...")
 
-        # Missing items
-        result = client.invoice().number("001").date("2026-01-15").seller("Acme").buyer("Customer").generate()
-        assert result.success is False
-        assert any(e.path == "$.invoice.items" for e in result.errors)
+        assert isinstance(exc_info.value.cause, httpx.ConnectError)
 
 
 class TestValidate:
     """Tests for PDF validation."""
 
-    def test_successful_validation(self, httpx_mock: HTTPXMock) -> None:
+    def test_successful_validation(self, client: EnvoiceClient, add_route: AddRoute) -> None:
         """Test successful PDF validation."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://api.envoice.dev/v1/validate",
-            json={
-                "valid": True,
-                "profile": "EN16931",
-                "version": "2.3.2",
-                "errors": [],
-                "warnings": [],
-            },
+        add_route(
+            "POST",
+            "https://api.envoice.dev/v1/validate",
+            json=_VALIDATE_OK_JSON,
         )
 
-        with EnvoiceClient("env_sandbox_test") as client:
-            result = client.validate("JVBERi0xLjQK...")
+        result = client.validate("JVBERi0xLjQK...")
 
         assert result["valid"] is True
         assert result["profile"] == "EN16931"
 
+    def test_validation_non_json_error(self, client: EnvoiceClient, add_route: AddRoute) -> None:
+        """Test that a non-JSON error body still raises EnvoiceApiError."""
+        add_route(
+            "POST",
+            "https://api.envoice.dev/v1/validate",
+            status_code=502,
+            text="<html>Bad Gateway</html>",
+        )
+
+        with pytest.raises(EnvoiceApiError) as exc_info:
+            client.validate("JVBERi0xLjQK...")
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.code == "unknown_error"
+
 
 class TestGetAccount:
     """Tests for account information."""
 
-    def test_get_account(self, httpx_mock: HTTPXMock) -> None:
+    def test_get_account(self, client: EnvoiceClient, add_route: AddRoute) -> None:
         """Test getting account information."""
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.envoice.dev/v1/account",
-            json={
-                "plan": "starter",
-                "remaining": 450,
-                "used": 50,
-                "limit": 500,
-            },
+        add_route(
+            "GET",
+            "https://api.envoice.dev/v1/account",
+            json=_ACCOUNT_JSON,
         )
 
-        with EnvoiceClient("env_sandbox_test") as client:
-            account = client.get_account()
+        account = client.get_account()
 
         assert account.plan == "starter"
         assert account.remaining == 450
 
+    def test_get_account_not_modified(
+        self, add_route: AddRoute, mock_transport: httpx.MockTransport
+    ) -> None:
+        """Test that a 304 response reuses the cached account information."""
+
+        def account(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json=_ACCOUNT_JSON)
+
+        add_route("GET", "https://api.envoice.dev/v1/account", account)
+
+        with EnvoiceClient("env_sandbox_test", transport=mock_transport) as client:
+            first = client.get_account()
+            second = client.get_account()
+
+        assert second is first
+        assert second.remaining == 450
+
 
 class TestAsyncClient:
     """Tests for async client methods."""
 
-    @pytest.mark.asyncio
-    async def test_async_generation(self, httpx_mock: HTTPXMock) -> None:
+    # One event loop serves every test in the module; under pytest-xdist
+    # (--dist=loadgroup) the group keeps these tests on the same worker.
+    pytestmark = [
+        pytest.mark.asyncio(loop_scope="module"),
+        pytest.mark.xdist_group("async_client"),
+    ]
+
+    @pytest.mark.usefixtures("async_client")
+    async def test_async_generation(
+        self, valid_invoice: InvoiceBuilder, add_route: AddRoute
+    ) -> None:
         """Test async invoice generation."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://api.envoice.dev/v1/generate",
-            json={
-                "pdf_base64": "JVBERi0xLjQK...",
-                "filename": "invoice-2026-001.pdf",
-                "validation": {
-                    "status": "valid",
-                    "profile": "EN16931",
-                    "version": "2.3.2",
-                },
-            },
+        add_route(
+            "POST",
+            "https://api.envoice.dev/v1/generate",
+            json={**_GENERATE_OK_JSON, "account": None},
         )
 
-        async with EnvoiceClient("env_sandbox_test") as client:
-            result = await (
-                client.invoice()
-                .number("2026-001")
-                .date("2026-01-15")
-                .seller("Acme GmbH", vat_id="DE123456789")
-                .buyer("Customer AG")
-                .add_item("Consulting", quantity=8, unit_price=150.0)
-                .generate_async()
-            )
+        result = await valid_invoice.generate_async()
 
         assert result.success is True
         assert result.filename == "invoice-2026-001.pdf"
 
-    @pytest.mark.asyncio
-    async def test_async_get_account(self, httpx_mock: HTTPXMock) -> None:
+    async def test_async_get_account(
+        self, async_client: EnvoiceClient, add_route: AddRoute
+    ) -> None:
         """Test async account retrieval."""
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.envoice.dev/v1/account",
-            json={
-                "plan": "pro",
-                "remaining": 1800,
-                "used": 200,
-                "limit": 2000,
-            },
+        add_route(
+            "GET",
+            "https://api.envoice.dev/v1/account",
+            json={**_ACCOUNT_JSON, "plan": "pro", "remaining": 1800, "used": 200, "limit": 2000},
         )
 
-        async with EnvoiceClient("env_sandbox_test") as client:
-            account = await client.get_account_async()
+        account = await async_client.get_account_async()
 
         assert account.plan == "pro"
         assert account.remaining == 1800
+
+    async def test_async_bulk_generation(
+        self, async_client: EnvoiceClient, add_route: AddRoute
+    ) -> None:
+        """Test generating several invoices concurrently."""
+        add_route("POST", "https://api.envoice.dev/v1/generate", _bulk_handler)
+
+        results = await async_client.generate_invoices_async(_bulk_requests(), concurrency=2)
+
+        assert [r.filename for r in results] == [f"invoice-{n}.pdf" for n in _BULK_NUMBERS]
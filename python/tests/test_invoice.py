@@ -1,21 +1,54 @@
 """Tests for the InvoiceBuilder."""
 
 import base64
-import tempfile
+import binascii
+import copy
 from datetime import date
 from pathlib import Path
 
+import pydantic
 import pytest
 
 from envoice import (
     EnvoiceClient,
     InvoiceBuilder,
-    InvoiceSuccess,
     InvoiceFailure,
-    Party,
+    InvoiceSuccess,
     LineItem,
+    Party,
+    ValidationError,
+    ValidationResult,
+)
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+_PNG_MAGIC_B64 = base64.b64encode(_PNG_MAGIC).decode("utf-8")
+
+# Minimal PDF document ("%PDF-1.4 ... %%EOF"), Base64 encoded
+_PDF_B64 = (
+    "JVBERi0xLjQKJeLjz9MKMSAwIG9iago8PC9UeXBlL0NhdGFsb2c+PgplbmRvYmoKdHJhaWxlcgo8PC9Sb290IDEg"
+    "MCBSPj4KJSVFT0YK"
 )
 
+# Shared model instances; tests only read them, never mutate them
+_SELLER_PARTY = Party(name="Acme GmbH", city="Berlin", country="DE")
+_ITEM_NEW_1 = LineItem(description="New Item 1", quantity=1, unit_price=100.0)
+_ITEM_NEW_2 = LineItem(description="New Item 2", quantity=2, unit_price=200.0)
+
+
+def _success_result(pdf_base64: str = _PDF_B64) -> InvoiceSuccess:
+    """Create a fresh success result for the given Base64 PDF."""
+    return InvoiceSuccess(
+        pdf_base64=pdf_base64,
+        filename="invoice-2026-001.pdf",
+        validation=ValidationResult(status="valid", profile="EN16931", version="2.3.2"),
+    )
+
+
+@pytest.fixture(scope="module")
+def success_result() -> InvoiceSuccess:
+    """Create a success result shared by the tests that only read it."""
+    return _success_result()
+
 
 class TestInvoiceBuilder:
     """Tests for the InvoiceBuilder class."""
@@ -30,18 +63,57 @@ class TestInvoiceBuilder:
         """Create a test builder."""
         return client.invoice()
 
-    def test_fluent_interface(self, builder: InvoiceBuilder) -> None:
-        """Test that all methods return self for chaining."""
-        result = (
-            builder
-            .number("2026-001")
-            .date("2026-01-15")
-            .due_date("2026-02-15")
-            .currency("EUR")
-            .template("minimal")
-            .locale("de")
-        )
-        assert result is builder
+    @pytest.mark.parametrize(
+        "method,arg",
+        [
+            ("number", "2026-001"),
+            ("date", "2026-01-15"),
+            ("due_date", "2026-02-15"),
+            ("currency", "EUR"),
+            ("template", "minimal"),
+            ("locale", "de"),
+        ],
+    )
+    def test_fluent_interface(self, builder: InvoiceBuilder, method: str, arg: str) -> None:
+        """Test that each setter returns self for chaining."""
+        assert getattr(builder, method)(arg) is builder
+
+    def test_builder_uses_slots(self, builder: InvoiceBuilder) -> None:
+        """Test that builders store their state in slots, not an instance dict."""
+        assert not hasattr(builder, "__dict__")
+        with pytest.raises(AttributeError):
+            builder._unknown = "value"  # type: ignore[attr-defined]
+
+    def test_copy(self, builder: InvoiceBuilder) -> None:
+        """Test that a copied builder can be changed without affecting the original."""
+        builder.number("2026-001").add_item("Item 1", quantity=1, unit_price=100.0)
+        builder.footer_text("Original")
+
+        clone = copy.copy(builder)
+        clone.number("2026-002").add_item("Item 2", quantity=2, unit_price=200.0)
+        clone.footer_text("Copy")
+
+        assert clone._client is builder._client
+        assert builder._number == "2026-001"
+        assert len(builder._items) == 1
+        assert len(clone._items) == 2
+        assert builder._customization.footer_text == "Original"
+
+    def test_deepcopy(self, builder: InvoiceBuilder) -> None:
+        """Test that a deep copy shares the client but not the models."""
+        builder.number("2026-001").seller("Acme").add_item("Item 1", quantity=1, unit_price=100.0)
+        builder.footer_text("Original")
+        builder._client._get_sync_client()
+
+        clone = copy.deepcopy(builder)
+        clone._seller.name = "Other"
+        clone._items[0].description = "Changed"
+        clone.footer_text("Copy")
+
+        assert clone._client is builder._client
+        assert builder._seller.name == "Acme"
+        assert builder._items[0].description == "Item 1"
+        assert builder._customization.footer_text == "Original"
 
     def test_date_with_string(self, builder: InvoiceBuilder) -> None:
         """Test setting date with string."""
@@ -75,9 +147,8 @@ class TestInvoiceBuilder:
 
     def test_seller_party(self, builder: InvoiceBuilder) -> None:
         """Test setting seller from Party object."""
-        party = Party(name="Acme GmbH", city="Berlin", country="DE")
-        builder.seller_party(party)
-        assert builder._seller == party
+        builder.seller_party(_SELLER_PARTY)
+        assert builder._seller is _SELLER_PARTY
 
     def test_buyer_with_kwargs(self, builder: InvoiceBuilder) -> None:
         """Test setting buyer with keyword arguments."""
@@ -111,12 +182,9 @@ class TestInvoiceBuilder:
     def test_items_replaces_all(self, builder: InvoiceBuilder) -> None:
         """Test that items() replaces all items."""
         builder.add_item("Old Item", quantity=1, unit_price=50.0)
-        builder.items([
-            LineItem(description="New Item 1", quantity=1, unit_price=100.0),
-            LineItem(description="New Item 2", quantity=2, unit_price=200.0),
-        ])
+        builder.items([_ITEM_NEW_1, _ITEM_NEW_2])
         assert len(builder._items) == 2
-        assert builder._items[0].description == "New Item 1"
+        assert builder._items[0] is _ITEM_NEW_1
 
     def test_payment(self, builder: InvoiceBuilder) -> None:
         """Test setting payment info."""
@@ -132,19 +200,14 @@ class TestInvoiceBuilder:
         assert builder._customization.logo_base64 == "iVBORw0KGgoAAAANS..."
         assert builder._customization.logo_width_mm == 30
 
-    def test_logo_file(self, builder: InvoiceBuilder) -> None:
+    def test_logo_file(self, builder: InvoiceBuilder, tmp_path: Path) -> None:
         """Test setting logo from file."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(b"\x89PNG\r\n\x1a\n")
-            temp_path = f.name
-
-        try:
-            builder.logo_file(temp_path, width_mm=25)
-            expected_base64 = base64.b64encode(b"\x89PNG\r\n\x1a\n").decode("utf-8")
-            assert builder._customization.logo_base64 == expected_base64
-            assert builder._customization.logo_width_mm == 25
-        finally:
-            Path(temp_path).unlink()
+        logo_path = tmp_path / "logo.png"
+        logo_path.write_bytes(_PNG_MAGIC)
+
+        builder.logo_file(str(logo_path), width_mm=25)
+        assert builder._customization.logo_base64 == _PNG_MAGIC_B64
+        assert builder._customization.logo_width_mm == 25
 
     def test_footer_text(self, builder: InvoiceBuilder) -> None:
         """Test setting footer text."""
@@ -156,50 +219,140 @@ class TestInvoiceBuilder:
         builder.accent_color("#8b5cf6")
         assert builder._customization.accent_color == "#8b5cf6"
 
-    def test_template_options(self, builder: InvoiceBuilder) -> None:
+    def test_customization_only_sent_when_set(self, builder: InvoiceBuilder) -> None:
+        """Test that customization is omitted until a setter is used."""
+        builder.number("2026-001").date("2026-01-15").seller("Acme").buyer("Customer")
+        builder.add_item("Item", quantity=1, unit_price=100.0)
+        assert builder._build_request().customization is None
+
+        builder.footer_text("Thank you for your business!")
+        request = builder._build_request()
+        assert request.customization is not None
+        assert request.customization.footer_text == "Thank you for your business!"
+
+    def test_customization_not_sent_for_empty_values(self, builder: InvoiceBuilder) -> None:
+        """Test that empty customization values do not add a customization block."""
+        builder.number("2026-001").date("2026-01-15").seller("Acme").buyer("Customer")
+        builder.add_item("Item", quantity=1, unit_price=100.0)
+        builder.footer_text("").logo_base64("", width_mm=30)
+        assert builder._build_request().customization is None
+
+        builder.accent_color("#0066cc").accent_color("")
+        assert builder._build_request().customization is None
+
+    def test_customization_set_directly_is_sent(self, builder: InvoiceBuilder) -> None:
+        """Test that customization assigned without a setter is still sent."""
+        builder.number("2026-001").date("2026-01-15").seller("Acme").buyer("Customer")
+        builder.add_item("Item", quantity=1, unit_price=100.0)
+        builder._customization.footer_text = "Thank you"
+        request = builder._build_request()
+        assert request.customization is not None
+        assert request.customization.footer_text == "Thank you"
+
+    @pytest.mark.parametrize("template", ["minimal", "classic", "compact"])
+    def test_template_options(self, builder: InvoiceBuilder, template: str) -> None:
         """Test different template options."""
-        for template in ["minimal", "classic", "compact"]:
-            builder.template(template)  # type: ignore
-            assert builder._template == template
+        builder.template(template)  # type: ignore
+        assert builder._template == template
 
 
 class TestInvoiceSuccess:
     """Tests for the InvoiceSuccess class."""
 
-    @pytest.fixture
-    def success_result(self) -> InvoiceSuccess:
-        """Create a test success result."""
-        from envoice import ValidationResult
-        return InvoiceSuccess(
-            pdf_base64="JVBERi0xLjQKJeLjz9MKMSAwIG9iago8PC9UeXBlL0NhdGFsb2c+PgplbmRvYmoKdHJhaWxlcgo8PC9Sb290IDEgMCBSPj4KJSVFT0YK",
-            filename="invoice-2026-001.pdf",
-            validation=ValidationResult(status="valid", profile="EN16931", version="2.3.2"),
-        )
+    def test_uses_slots(self, success_result: InvoiceSuccess) -> None:
+        """Test that results store their state in slots, not an instance dict."""
+        assert not hasattr(success_result, "__dict__")
+        assert not hasattr(InvoiceFailure(errors=[]), "__dict__")
 
     def test_success_property(self, success_result: InvoiceSuccess) -> None:
         """Test success property."""
         assert success_result.success is True
 
-    def test_to_bytes(self, success_result: InvoiceSuccess) -> None:
+    def test_to_bytes(self) -> None:
         """Test converting to bytes."""
-        pdf_bytes = success_result.to_bytes()
+        pdf_bytes = _success_result().to_bytes()
         assert isinstance(pdf_bytes, bytes)
         assert pdf_bytes.startswith(b"%PDF")
 
+    def test_to_bytes_decodes_once(self) -> None:
+        """Test that the decoded PDF is reused between calls."""
+        result = _success_result()
+        assert result.to_bytes() is result.to_bytes()
+
     def test_to_data_url(self, success_result: InvoiceSuccess) -> None:
         """Test converting to data URL."""
         data_url = success_result.to_data_url()
         assert data_url.startswith("data:application/pdf;base64,")
 
-    def test_save_pdf(self, success_result: InvoiceSuccess) -> None:
-        """Test saving PDF to file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file_path = Path(temp_dir) / "subdir" / "invoice.pdf"
-            success_result.save_pdf(file_path)
+    def test_save_pdf(self, tmp_path: Path) -> None:
+        """Test saving PDF to file by decoding the Base64 in chunks."""
+        result = _success_result()
+        file_path = tmp_path / "subdir" / "invoice.pdf"
+        result.save_pdf(file_path)
+
+        assert file_path.read_bytes() == base64.b64decode(_PDF_B64)
+        assert result._pdf_bytes is None
+
+    def test_save_pdf_after_to_bytes(self, tmp_path: Path) -> None:
+        """Test that saving reuses the bytes already decoded by to_bytes()."""
+        result = _success_result()
+        pdf_bytes = result.to_bytes()
+        file_path = tmp_path / "invoice.pdf"
+        result.save_pdf(file_path)
+
+        assert file_path.read_bytes() == pdf_bytes
+
+    def test_save_pdf_overwrites(self, tmp_path: Path) -> None:
+        """Test that saving replaces the contents of an existing file."""
+        file_path = tmp_path / "invoice.pdf"
+        file_path.write_bytes(b"x" * 10_000)
+
+        _success_result().save_pdf(file_path)
+
+        assert file_path.read_bytes() == base64.b64decode(_PDF_B64)
 
-            assert file_path.exists()
-            content = file_path.read_bytes()
-            assert content.startswith(b"%PDF")
+    def test_save_large_pdf(self, tmp_path: Path) -> None:
+        """Test saving a PDF larger than one decode chunk."""
+        pdf_bytes = b"%PDF-1.4\n" + bytes(range(256)) * 1000
+        result = _success_result(base64.b64encode(pdf_bytes).decode("ascii"))
+
+        file_path = tmp_path / "large.pdf"
+        result.save_pdf(file_path)
+
+        assert file_path.read_bytes() == pdf_bytes
+
+    def test_save_wrapped_pdf(self, tmp_path: Path) -> None:
+        """Test saving a PDF whose Base64 is wrapped into lines."""
+        pdf_bytes = b"%PDF-1.4\n" + bytes(range(256)) * 1000
+        result = _success_result(base64.encodebytes(pdf_bytes).decode("ascii"))
+
+        file_path = tmp_path / "wrapped.pdf"
+        result.save_pdf(file_path)
+
+        assert file_path.read_bytes() == pdf_bytes
+
+    def test_save_invalid_pdf_raises_before_opening(self, tmp_path: Path) -> None:
+        """Test that invalid Base64 raises before the target is truncated."""
+        result = _success_result("JVBERi0")
+        file_path = tmp_path / "invoice.pdf"
+        file_path.write_bytes(b"important")
+
+        with pytest.raises(binascii.Error):
+            result.save_pdf(file_path)
+
+        assert file_path.read_bytes() == b"important"
+
+    def test_save_pdf_through_symlink(self, tmp_path: Path) -> None:
+        """Test that saving to a symlink writes the file it points to."""
+        target = tmp_path / "archive.pdf"
+        target.write_bytes(b"old")
+        link = tmp_path / "latest.pdf"
+        link.symlink_to(target)
+
+        _success_result().save_pdf(link)
+
+        assert link.is_symlink()
+        assert target.read_bytes() == base64.b64decode(_PDF_B64)
 
 
 class TestInvoiceFailure:
@@ -207,9 +360,14 @@ class TestInvoiceFailure:
 
     def test_failure_property(self) -> None:
         """Test failure property."""
-        from envoice import ValidationError
         failure = InvoiceFailure(errors=[
             ValidationError(path="$.invoice.number", code="REQUIRED", message="Required"),
         ])
         assert failure.success is False
         assert len(failure.errors) == 1
+
+    def test_validation_error_is_immutable(self) -> None:
+        """Test that validation errors cannot be modified."""
+        error = ValidationError(path="$.invoice.number", code="REQUIRED", message="Required")
+        with pytest.raises(pydantic.ValidationError):
+            error.message = "Changed"  # type: ignore[misc]